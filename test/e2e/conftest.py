@@ -32,6 +32,7 @@ from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
 
 SERVER_PORT = 8080
+_PORT_FORWARD_RE = re.compile(r"Forwarding from 127\.0\.0\.1:(\d+)")
 
 
 # ---------------------------------------------------------------------------
@@ -366,7 +367,7 @@ def _start_port_forward(
     while time.monotonic() < deadline:
         stdout_file.seek(0)
         output = stdout_file.read().decode(errors="replace")
-        m = re.search(r"Forwarding from 127\.0\.0\.1:(\d+)", output)
+        m = _PORT_FORWARD_RE.search(output)
         if m:
             return f"http://127.0.0.1:{int(m.group(1))}", proc
         if proc.poll() is not None:
@@ -377,7 +378,7 @@ def _start_port_forward(
     # Re-read once more in case a final flush landed after the last poll.
     stdout_file.seek(0)
     out = stdout_file.read().decode(errors="replace")
-    m = re.search(r"Forwarding from 127\.0\.0\.1:(\d+)", out)
+    m = _PORT_FORWARD_RE.search(out)
     if m:
         return f"http://127.0.0.1:{int(m.group(1))}", proc
     try: